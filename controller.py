@@ -34,6 +34,8 @@ class Controller:
                 elif choice == '7':
                     self.search_data()
                 elif choice == '8':
+                    self.manage_partitions()
+                elif choice == '9':
                     self.view.show_message("Goodbye!")
                     break
             except Exception as e:
@@ -144,4 +146,34 @@ class Controller:
             results, execution_time = self.model.search_data(criteria)
             self.view.show_search_results(results, execution_time)
         else:
-            self.view.show_error("No search criteria provided")
\ No newline at end of file
+            self.view.show_error("No search criteria provided")
+
+    def manage_partitions(self):
+        """Manage range partitions of the order table."""
+        choice = self.view.show_partition_menu()
+        if choice == '1':
+            partitions = self.model.get_order_partitions()
+            if partitions:
+                self.view.show_partitions(partitions)
+            else:
+                self.view.show_error("Table 'order' is not partitioned or error occurred")
+            return
+        elif choice == '2':
+            partition_size, future = self.view.get_partitioning_params(self.model.ORDER_PARTITION_MIN_SIZE)
+            success, message = self.model.partition_order_table(partition_size, future)
+        elif choice == '3':
+            count = self.view.get_positive_number("Enter number of partitions to create: ")
+            success, message = self.model.create_future_order_partitions(count)
+        elif choice == '4':
+            before_id, archive = self.view.get_archive_params()
+            confirm = input("Are you sure you want to detach these partitions? (y/n): ")
+            if confirm.lower() != 'y':
+                return
+            success, message = self.model.archive_order_partitions(before_id, archive)
+        else:
+            return
+
+        if success:
+            self.view.show_message(message)
+        else:
+            self.view.show_error(message)
\ No newline at end of file
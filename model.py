@@ -1,12 +1,17 @@
 import psycopg2
 from datetime import datetime
 import random
+import re
 import string
 import time
 from typing import List, Tuple, Dict, Optional, Any
 
 
 class Model:
+    # Bounds on range partitioning of the order table
+    ORDER_PARTITION_MIN_SIZE = 1000
+    ORDER_PARTITION_LIMIT = 256
+
     def __init__(self):
         try:
             self.conn = psycopg2.connect(
@@ -29,6 +34,12 @@ class Model:
                 FROM information_schema.tables 
                 WHERE table_schema = 'public' 
                 AND table_type = 'BASE TABLE'
+                AND table_name NOT IN (
+                    SELECT c.relname
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relispartition
+                )
                 ORDER BY table_name;
             """)
             return c.fetchall()
@@ -135,6 +146,17 @@ class Model:
             if conditions:
                 base_query += " AND (" + " OR ".join(conditions) + ")"
 
+            # Order ID range restricts the whole result (it is not OR-ed with the
+            # other criteria), so the planner can prune "order" partitions
+            if 'order_id_range' in criteria:
+                min_id, max_id = criteria['order_id_range']
+                if min_id is not None:
+                    base_query += " AND o.order_id >= %s"
+                    params.append(min_id)
+                if max_id is not None:
+                    base_query += " AND o.order_id <= %s"
+                    params.append(max_id)
+
             # Add ordering using the sort columns we included in SELECT
             base_query += """
                 ORDER BY 
@@ -163,6 +185,9 @@ class Model:
 
     def generate_random_data(self, table_name: str, count: int) -> Tuple[bool, str]:
         """Generate random data using PostgreSQL functions."""
+        if table_name not in ('supplier', 'warehouse', 'sparepart', 'order'):
+            return False, f"Random data generation not implemented for table {table_name}"
+
         c = self.conn.cursor()
         try:
             # First, find the maximum existing ID for the table
@@ -222,6 +247,19 @@ class Model:
                 if warehouse_count == 0:
                     return False, "No warehouses found. Please add warehouses first."
 
+                # Make sure partitions exist for the new order IDs. New IDs start
+                # no lower than the lowest attached partition, so they stay above
+                # any archived orders even when the attached partitions are empty.
+                if self._is_partitioned(c, 'order'):
+                    partitions = self._get_order_partitions(c)
+                    if partitions:
+                        max_id = max(max_id, partitions[0][1] - 1)
+                    ranges, error = self._plan_order_partitions(c, up_to_id=max_id + count)
+                    if error:
+                        self.conn.rollback()
+                        return False, error
+                    self._create_order_partitions(c, ranges)
+
                 # Generate orders with random related IDs for each order
                 c.execute("""
                     WITH order_data AS (
@@ -242,9 +280,6 @@ class Model:
                     RETURNING order_id;
                 """, [max_id + 1, max_id + count])
 
-            else:
-                return False, f"Random data generation not implemented for table {table_name}"
-
             self.conn.commit()
             return True, f"Successfully generated {count} records for {table_name}"
 
@@ -333,6 +368,342 @@ class Model:
         finally:
             c.close()
 
+    def get_order_partitions(self) -> List[Tuple]:
+        """Get partitions of the order table with their bounds and estimated row counts."""
+        c = self.conn.cursor()
+        try:
+            if not self._is_partitioned(c, 'order'):
+                return []
+            return self._get_order_partitions(c)
+        except psycopg2.Error as e:
+            print(f"Error fetching partitions: {e}")
+            return []
+        finally:
+            c.close()
+
+    def partition_order_table(self, partition_size: int, future_partitions: int) -> Tuple[bool, str]:
+        """Convert the order table to a table range-partitioned on order_id."""
+        if partition_size < self.ORDER_PARTITION_MIN_SIZE:
+            return False, f"Partition size must be at least {self.ORDER_PARTITION_MIN_SIZE}"
+
+        c = self.conn.cursor()
+        try:
+            if self._is_partitioned(c, 'order'):
+                self.conn.rollback()
+                return False, 'Table "order" is already partitioned'
+
+            blockers = self._get_order_partitioning_blockers(c)
+            if blockers:
+                self.conn.rollback()
+                return False, 'Cannot partition "order": ' + "; ".join(blockers)
+
+            c.execute('LOCK TABLE "order" IN ACCESS EXCLUSIVE MODE;')
+            c.execute('SELECT MIN(order_id), MAX(order_id) FROM "order";')
+            min_id, max_id = c.fetchone()
+            if min_id is None:
+                min_id, max_id = 1, 0
+
+            # Partition boundaries are aligned to multiples of the partition size
+            first_lower = (min_id // partition_size) * partition_size
+            total = max(max_id // partition_size - min_id // partition_size, 0) + 1 + future_partitions
+            if total > self.ORDER_PARTITION_LIMIT:
+                self.conn.rollback()
+                return False, (f"Partitioning would create {total} partitions "
+                               f"(limit {self.ORDER_PARTITION_LIMIT}); choose a larger partition size")
+
+            # Everything below is re-created with its original name once the old table is gone
+            c.execute("""
+                SELECT conname, pg_get_constraintdef(oid)
+                FROM pg_constraint
+                WHERE conrelid = '"order"'::regclass
+                AND contype IN ('p', 'u', 'f', 'c', 'x')
+                ORDER BY contype = 'p' DESC, conname;
+            """)
+            constraints = c.fetchall()
+
+            # Indexes not backing a constraint (e.g. on the join columns)
+            c.execute("""
+                SELECT pg_get_indexdef(i.indexrelid)
+                FROM pg_index i
+                WHERE i.indrelid = '"order"'::regclass
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_constraint con
+                    WHERE con.conrelid = i.indrelid AND con.conindid = i.indexrelid
+                );
+            """)
+            indexes = [row[0] for row in c.fetchall()]
+
+            c.execute("""
+                SELECT pg_get_triggerdef(oid)
+                FROM pg_trigger
+                WHERE tgrelid = '"order"'::regclass AND NOT tgisinternal;
+            """)
+            triggers = [row[0] for row in c.fetchall()]
+
+            owner, grants = self._get_table_privileges(c, '"order"')
+
+            # Sequences owned by the old table (serial columns) must survive its drop
+            c.execute("""
+                SELECT s.oid::regclass::text, quote_ident(a.attname)
+                FROM pg_depend d
+                JOIN pg_class s ON s.oid = d.objid AND s.relkind = 'S'
+                JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid
+                WHERE d.refobjid = '"order"'::regclass
+                AND d.deptype = 'a';
+            """)
+            owned_sequences = c.fetchall()
+
+            # Identity columns get a new sequence, which continues where the old one stopped
+            c.execute("""
+                SELECT attname, pg_get_serial_sequence('"order"', attname)
+                FROM pg_attribute
+                WHERE attrelid = '"order"'::regclass AND attidentity <> '';
+            """)
+            identity_positions = []
+            for column, sequence in c.fetchall():
+                c.execute(f"SELECT last_value, is_called FROM {sequence};")
+                identity_positions.append((column,) + c.fetchone())
+
+            c.execute('ALTER TABLE "order" RENAME TO order_unpartitioned;')
+            c.execute("""
+                CREATE TABLE "order" (
+                    LIKE order_unpartitioned INCLUDING ALL EXCLUDING INDEXES EXCLUDING CONSTRAINTS
+                )
+                PARTITION BY RANGE (order_id);
+            """)
+            # Set before the partitions are created, so they take over owner and grants
+            self._set_table_privileges(c, '"order"', owner, grants)
+
+            ranges = [(first_lower + i * partition_size, first_lower + (i + 1) * partition_size)
+                      for i in range(total)]
+            self._create_order_partitions(c, ranges)
+
+            # Generated columns are computed again on insert
+            c.execute("""
+                SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+                FROM pg_attribute
+                WHERE attrelid = 'order_unpartitioned'::regclass
+                AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+            """)
+            columns = c.fetchone()[0]
+            c.execute(f"""
+                INSERT INTO "order" ({columns}) OVERRIDING SYSTEM VALUE
+                SELECT {columns} FROM order_unpartitioned;
+            """)
+            moved = c.rowcount
+
+            for sequence, column in owned_sequences:
+                c.execute(f'ALTER SEQUENCE {sequence} OWNED BY "order".{column};')
+            for column, last_value, is_called in identity_positions:
+                c.execute("""SELECT setval(pg_get_serial_sequence('"order"', %s), %s, %s);""",
+                          (column, last_value, is_called))
+
+            c.execute('DROP TABLE order_unpartitioned;')
+            for name, definition in constraints:
+                c.execute(f'ALTER TABLE "order" ADD CONSTRAINT "{name}" {definition};')
+            for definition in indexes + triggers:
+                c.execute(definition)
+
+            # Autovacuum never analyzes the partitioned parent itself
+            c.execute('ANALYZE "order";')
+
+            self.conn.commit()
+            return True, f"Table order partitioned: {moved} rows moved into {total} partitions"
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            return False, f"Partitioning failed: {e}"
+        finally:
+            c.close()
+
+    def create_future_order_partitions(self, count: int) -> Tuple[bool, str]:
+        """Create empty partitions of the order table above the current highest one."""
+        c = self.conn.cursor()
+        try:
+            if not self._is_partitioned(c, 'order'):
+                self.conn.rollback()
+                return False, 'Table "order" is not partitioned'
+
+            ranges, error = self._plan_order_partitions(c, extra=count)
+            if error:
+                self.conn.rollback()
+                return False, error
+            self._create_order_partitions(c, ranges)
+
+            self.conn.commit()
+            return True, f"Successfully created {len(ranges)} partitions for order"
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            return False, f"Partition creation failed: {e}"
+        finally:
+            c.close()
+
+    def archive_order_partitions(self, before_id: int, archive: bool) -> Tuple[bool, str]:
+        """Detach order partitions holding only IDs below before_id, optionally moving them to the archive schema."""
+        c = self.conn.cursor()
+        try:
+            if not self._is_partitioned(c, 'order'):
+                self.conn.rollback()
+                return False, 'Table "order" is not partitioned'
+
+            partitions = self._get_order_partitions(c)
+            old = [name for name, _, upper, _ in partitions if upper <= before_id]
+            if not old:
+                self.conn.rollback()
+                return False, f"No partitions found below order_id {before_id}"
+            if len(old) == len(partitions):
+                self.conn.rollback()
+                return False, "Cannot detach every partition of order"
+
+            if archive:
+                c.execute("CREATE SCHEMA IF NOT EXISTS order_archive;")
+            for name in old:
+                c.execute(f'ALTER TABLE "order" DETACH PARTITION "{name}";')
+                if archive:
+                    c.execute(f'ALTER TABLE "{name}" SET SCHEMA order_archive;')
+
+            self.conn.commit()
+            action = "archived" if archive else "detached"
+            return True, f"Successfully {action} {len(old)} partitions: {', '.join(old)}"
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            return False, f"Partition detach failed: {e}"
+        finally:
+            c.close()
+
+    def _is_partitioned(self, c, table_name: str) -> bool:
+        """Check whether a public table is declaratively partitioned."""
+        c.execute("""
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_partitioned_table pt
+                JOIN pg_class t ON t.oid = pt.partrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = 'public' AND t.relname = %s
+            );
+        """, (table_name,))
+        return c.fetchone()[0]
+
+    def _get_order_partitions(self, c) -> List[Tuple]:
+        """Get (name, lower, upper, estimated rows) for each order partition, ordered by bounds."""
+        c.execute("""
+            SELECT p.relname, pg_get_expr(p.relpartbound, p.oid), p.reltuples::bigint
+            FROM pg_inherits i
+            JOIN pg_class p ON p.oid = i.inhrelid
+            WHERE i.inhparent = '"order"'::regclass;
+        """)
+        partitions = []
+        for name, bound, rows in c.fetchall():
+            match = re.search(r"FROM \('?(-?\d+)'?\) TO \('?(-?\d+)'?\)", bound)
+            if match:
+                partitions.append((name, int(match.group(1)), int(match.group(2)), max(rows, 0)))
+        return sorted(partitions, key=lambda p: p[1])
+
+    def _get_order_partitioning_blockers(self, c) -> List[str]:
+        """Describe objects on the order table that partitioning cannot carry over."""
+        blockers = []
+
+        c.execute("""
+            SELECT conrelid::regclass::text
+            FROM pg_constraint
+            WHERE confrelid = '"order"'::regclass AND conrelid <> confrelid;
+        """)
+        tables = sorted({row[0] for row in c.fetchall()})
+        if tables:
+            blockers.append(f"referenced by foreign keys from {', '.join(tables)}")
+
+        c.execute("""
+            SELECT DISTINCT r.ev_class::regclass::text
+            FROM pg_depend d
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE d.classid = 'pg_rewrite'::regclass
+            AND d.refobjid = '"order"'::regclass
+            AND r.ev_class <> '"order"'::regclass;
+        """)
+        views = sorted(row[0] for row in c.fetchall())
+        if views:
+            blockers.append(f"used by views {', '.join(views)}")
+
+        # Unique indexes on a partitioned table must contain the partition key
+        c.execute("""
+            SELECT i.indexrelid::regclass::text
+            FROM pg_index i
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attname = 'order_id'
+            WHERE i.indrelid = '"order"'::regclass
+            AND i.indisunique
+            AND NOT a.attnum = ANY(i.indkey::int2[]);
+        """)
+        indexes = sorted(row[0] for row in c.fetchall())
+        if indexes:
+            blockers.append(f"unique indexes without order_id: {', '.join(indexes)}")
+
+        c.execute("""SELECT polname FROM pg_policy WHERE polrelid = '"order"'::regclass;""")
+        policies = sorted(row[0] for row in c.fetchall())
+        if policies:
+            blockers.append(f"row-level security policies {', '.join(policies)}")
+
+        return blockers
+
+    def _plan_order_partitions(self, c, up_to_id: Optional[int] = None,
+                               extra: int = 0) -> Tuple[List[Tuple[int, int]], str]:
+        """Get the [lower, upper) ranges of partitions sized like the highest one needed
+        to cover up_to_id, plus extra spare ones, or an error message."""
+        partitions = self._get_order_partitions(c)
+        if not partitions:
+            return [], 'Table "order" has no range partitions to extend'
+
+        _, lower, upper, _ = partitions[-1]
+        partition_size = upper - lower
+        needed = 0
+        if up_to_id is not None and up_to_id >= upper:
+            needed = (up_to_id - upper) // partition_size + 1
+        needed += extra
+
+        if len(partitions) + needed > self.ORDER_PARTITION_LIMIT:
+            return [], (f"Order would need {len(partitions) + needed} partitions "
+                        f"(limit {self.ORDER_PARTITION_LIMIT}); detach old partitions first")
+        return [(upper + i * partition_size, upper + (i + 1) * partition_size)
+                for i in range(needed)], ""
+
+    def _create_order_partitions(self, c, ranges: List[Tuple[int, int]]) -> None:
+        """Create an order partition for each [lower, upper) range of order IDs,
+        with the same owner and grants as the order table."""
+        if not ranges:
+            return
+        owner, grants = self._get_table_privileges(c, '"order"')
+        for lower, upper in ranges:
+            c.execute(f"""
+                CREATE TABLE "order_p{lower}"
+                PARTITION OF "order" FOR VALUES FROM ({lower}) TO ({upper});
+            """)
+            self._set_table_privileges(c, f'"order_p{lower}"', owner, grants)
+
+    def _get_table_privileges(self, c, table: str) -> Tuple[str, List[Tuple]]:
+        """Get the quoted owner and (grantee, privilege, grantable) grants of a table."""
+        c.execute("""
+            SELECT quote_ident(pg_get_userbyid(relowner))
+            FROM pg_class
+            WHERE oid = %s::regclass;
+        """, (table,))
+        owner = c.fetchone()[0]
+        c.execute("""
+            SELECT CASE WHEN a.grantee = 0 THEN 'PUBLIC'
+                        ELSE quote_ident(pg_get_userbyid(a.grantee)) END,
+                   a.privilege_type, a.is_grantable
+            FROM pg_class t, aclexplode(t.relacl) a
+            WHERE t.oid = %s::regclass AND a.grantee <> t.relowner;
+        """, (table,))
+        return owner, c.fetchall()
+
+    def _set_table_privileges(self, c, table: str, owner: str, grants: List[Tuple]) -> None:
+        """Give a table the owner and grants returned by _get_table_privileges."""
+        c.execute(f'ALTER TABLE {table} OWNER TO {owner};')
+        for grantee, privilege, grantable in grants:
+            option = " WITH GRANT OPTION" if grantable else ""
+            c.execute(f'GRANT {privilege} ON {table} TO {grantee}{option};')
+
     def __del__(self):
         """Ensure database connection is closed."""
         if hasattr(self, 'conn'):
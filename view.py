@@ -14,10 +14,11 @@ class View:
             print("5. Delete Data")
             print("6. Generate Random Data")
             print("7. Search Data")
-            print("8. Exit")
+            print("8. Manage Order Partitions")
+            print("9. Exit")
 
-            choice = input("\nEnter your choice (1-8): ")
-            if choice in ('1', '2', '3', '4', '5', '6', '7', '8'):
+            choice = input("\nEnter your choice (1-9): ")
+            if choice in ('1', '2', '3', '4', '5', '6', '7', '8', '9'):
                 return choice
 
             self.show_error("Invalid choice. Please try again.")
@@ -100,6 +101,18 @@ class View:
         except ValueError:
             self.show_error("Invalid quantity range - skipping")
 
+        # Order ID range
+        try:
+            min_order = input("Minimum order ID (or Enter to skip): ").strip()
+            max_order = input("Maximum order ID (or Enter to skip): ").strip()
+            if min_order or max_order:
+                criteria['order_id_range'] = (
+                    int(min_order) if min_order else None,
+                    int(max_order) if max_order else None
+                )
+        except ValueError:
+            self.show_error("Invalid order ID range - skipping")
+
         # Warehouse ID
         warehouse_id = input("Warehouse ID (or Enter to skip): ").strip()
         if warehouse_id.isdigit():
@@ -178,4 +191,55 @@ class View:
                     raise ValueError
                 return table_name, count
             except ValueError:
-                self.show_error("Please enter a valid positive number")
\ No newline at end of file
+                self.show_error("Please enter a valid positive number")
+
+    def show_partition_menu(self) -> str:
+        """Display order partition management menu and get user choice."""
+        while True:
+            print("\n=== Order Partitions ===")
+            print("1. View Partitions")
+            print("2. Convert Order Table to Partitioned")
+            print("3. Create Future Partitions")
+            print("4. Detach/Archive Old Partitions")
+            print("5. Back")
+
+            choice = input("\nEnter your choice (1-5): ")
+            if choice in ('1', '2', '3', '4', '5'):
+                return choice
+
+            self.show_error("Invalid choice. Please try again.")
+
+    def show_partitions(self, partitions: List[Tuple]) -> None:
+        """Display order partitions with their order ID ranges."""
+        print("\n=== Order Partitions ===")
+        print("Name".ljust(30) + "Order IDs".ljust(30) + "Rows (est.)")
+        print("-" * 75)
+        for name, lower, upper, rows in partitions:
+            print(f"{name.ljust(30)}{f'{lower} - {upper - 1}'.ljust(30)}{rows}")
+
+    def get_positive_number(self, prompt: str, allow_zero: bool = False) -> int:
+        """Get a positive (or non-negative) integer from user."""
+        while True:
+            try:
+                number = int(input(prompt))
+                if number < 0 or (number == 0 and not allow_zero):
+                    raise ValueError
+                return number
+            except ValueError:
+                self.show_error("Please enter a valid positive number")
+
+    def get_partitioning_params(self, min_size: int) -> Tuple[int, int]:
+        """Get partition size and number of future partitions for conversion."""
+        while True:
+            partition_size = self.get_positive_number(f"Enter number of order IDs per partition (at least {min_size}): ")
+            if partition_size >= min_size:
+                break
+            self.show_error(f"Partition size must be at least {min_size}")
+        future = self.get_positive_number("Enter number of future partitions to create: ", allow_zero=True)
+        return partition_size, future
+
+    def get_archive_params(self) -> Tuple[int, bool]:
+        """Get order ID cutoff and whether old partitions should be archived."""
+        before_id = self.get_positive_number("Detach partitions with all order IDs below: ")
+        archive = input("Move detached partitions to the order_archive schema? (y/n): ")
+        return before_id, archive.lower() == 'y'
\ No newline at end of file